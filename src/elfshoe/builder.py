@@ -1,27 +1,118 @@
 """Distribution menu builder."""
 
+import logging
+import string
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from .core import ARCH_X86_64, DEFAULT_ARCH_MAPS, BootEntry, DistributionMenu, URLValidator
+from .core import (
+    ARCH_X86_64,
+    DEFAULT_ARCH_MAPS,
+    BootEntry,
+    DistributionMenu,
+    URLValidator,
+    VersionObject,
+)
 from .distributions import get_metadata_fetcher
 
+# Fallback mapping for distributions without a custom or default arch_map.
+# Shared module-level constant so _get_arch_map doesn't rebuild it per call.
+_IDENTITY_ARCH_MAP = {ARCH_X86_64: ARCH_X86_64, "arm64": "arm64", "i386": "i386"}
+
+# Translation table for iPXE-safe entry ids (single pass, no intermediates)
+_ID_TRANS = str.maketrans("-.", "__")
+
+logger = logging.getLogger(__name__)
+
+
+def _make_id(*parts: str) -> str:
+    """Join parts into an iPXE-safe identifier.
+
+    Dashes and dots become underscores in a single translate pass.
+
+    Args:
+        parts: Identifier components (e.g. dist id, version, arch)
+
+    Returns:
+        Joined, sanitized identifier
+    """
+    return "_".join(parts).translate(_ID_TRANS)
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str):
+    """Compile a str.format-style template into a reusable closure.
+
+    str.format reparses the template on every call; for templates that
+    are applied once per (version, arch) entry this adds up. The parsed
+    segments are computed once here and rendering is a join. Templates
+    using positional fields, format specs, or conversions fall back to
+    plain str.format.
+
+    Args:
+        template: Format string with named fields (e.g. '{version}')
+
+    Returns:
+        Callable accepting the template's fields as keyword arguments
+    """
+    segments = list(string.Formatter().parse(template))
+
+    if any(
+        field == "" or spec or conversion
+        for _literal, field, spec, conversion in segments
+        if field is not None
+    ):
+        return template.format
+
+    def render(**fields: Any) -> str:
+        parts = []
+        for literal, field, _spec, _conversion in segments:
+            if literal:
+                parts.append(literal)
+            if field is not None:
+                parts.append(str(fields[field]))
+        return "".join(parts)
+
+    return render
+
 
 class DistributionBuilder:
     """Builds distribution menus from configuration."""
 
-    def __init__(self, config: Dict[str, Any], validate_urls: bool = True, verbose: bool = True):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        validate_urls: bool = True,
+        verbose: bool = True,
+        max_workers: int = 8,
+        metadata_cache_dir: Optional[Path] = None,
+    ):
         """Initialize distribution builder.
 
         Args:
             config: Configuration dictionary
             validate_urls: Whether to validate URLs before including
             verbose: Print progress messages
+            max_workers: Number of threads used for concurrent URL validation
+            metadata_cache_dir: Optional directory for persistent metadata
+                caches; passed through to fetchers that support one
         """
         self.config = config
         self.validate_urls = validate_urls
         self.verbose = verbose
         self.validation_errors = []
+        self.max_workers = max_workers
+        self.metadata_cache_dir = metadata_cache_dir
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Memoized verify_boot_files results, keyed by (base_url, kernel, initrd).
+        # Shared across distributions so duplicate mirror URLs are probed once.
+        self._verify_cache: Dict[Any, bool] = {}
+        # One fetcher instance per metadata provider, shared across
+        # distributions so each fetcher's metadata cache is reused
+        self._fetchers: Dict[str, Any] = {}
 
     def _get_architectures(self, dist_id: str, dist_config: Dict[str, Any]) -> List[str]:
         """Get list of supported architectures for a distribution.
@@ -69,7 +160,125 @@ class DistributionBuilder:
             return DEFAULT_ARCH_MAPS[dist_id]
 
         # Default: identity mapping
-        return {ARCH_X86_64: ARCH_X86_64, "arm64": "arm64", "i386": "i386"}
+        return _IDENTITY_ARCH_MAP
+
+    def _arch_config(self, dist_config: Dict[str, Any], ipxe_arch: str) -> Dict[str, Any]:
+        """Resolve the effective configuration for one architecture.
+
+        Args:
+            dist_config: Distribution configuration
+            ipxe_arch: iPXE architecture name
+
+        Returns:
+            dist_config merged with any per-arch overrides
+        """
+        architectures = dist_config.get("architectures")
+        if isinstance(architectures, dict) and ipxe_arch in architectures:
+            # Per-arch configuration overrides
+            return {**dist_config, **architectures[ipxe_arch]}
+        return dist_config
+
+    def _make_entry_builder(
+        self, dist_id: str, dist_config: Dict[str, Any], arch_map: Dict[str, str]
+    ):
+        """Specialize entry construction for one distribution.
+
+        Hoists everything that is constant across a distribution's
+        (version, arch) grid - config lookups, validation settings, the
+        per-arch merged configs - into closure locals, so each call only
+        pays for URL formatting, validation, and BootEntry construction.
+
+        Args:
+            dist_id: Distribution identifier
+            dist_config: Distribution configuration
+            arch_map: Architecture name mapping
+
+        Returns:
+            Callable (version, ipxe_arch, label) -> Optional[BootEntry]
+        """
+        validate_urls = self.validate_urls
+        verbose = self.verbose
+        verify_cache = self._verify_cache
+
+        # Per-arch (url_template, kernel, initrd, boot_params, has_arch),
+        # resolved lazily
+        resolved_configs: Dict[str, Any] = {}
+
+        # base_url per (template, version) for templates without {arch},
+        # shared across that version's architectures
+        base_url_cache: Dict[Any, str] = {}
+
+        def _resolve(ipxe_arch: str):
+            resolved = resolved_configs.get(ipxe_arch)
+            if resolved is None:
+                arch_config = self._arch_config(dist_config, ipxe_arch)
+                url_template = arch_config["url_template"]
+                boot_params = arch_config.get("boot_params", "")
+                resolved = (
+                    _compile_template(url_template),
+                    arch_config["boot_files"]["kernel"],
+                    arch_config["boot_files"]["initrd"],
+                    _compile_template(boot_params) if boot_params else None,
+                    "{arch}" in url_template,
+                    url_template,
+                )
+                resolved_configs[ipxe_arch] = resolved
+            return resolved
+
+        def build(
+            version: str, ipxe_arch: str, label: str, validate: bool = True
+        ) -> Optional[BootEntry]:
+            render_url, kernel_path, initrd_path, render_params, has_arch, url_template = _resolve(
+                ipxe_arch
+            )
+
+            # Map iPXE arch to distribution arch
+            dist_arch = arch_map.get(ipxe_arch, ipxe_arch)
+
+            # Format URL with version and architecture; arch-less templates
+            # share one base_url per version
+            if has_arch:
+                base_url = render_url(version=version, arch=dist_arch)
+            else:
+                url_key = (url_template, version)
+                base_url = base_url_cache.get(url_key)
+                if base_url is None:
+                    base_url = render_url(version=version)
+                    base_url_cache[url_key] = base_url
+
+            # Full URLs are needed whether or not validation runs
+            kernel_url = f"{base_url}/{kernel_path}"
+            initrd_url = f"{base_url}/{initrd_path}"
+
+            # Validate URLs if requested (memoized per run, so identical URL
+            # tuples are only probed once). verify_boot_files stays the
+            # entry point here because callers patch it to stub validation.
+            if validate_urls and validate:
+                cache_key = (base_url, kernel_path, initrd_path)
+                validation_result = verify_cache.get(cache_key)
+                if validation_result is None:
+                    validation_result = URLValidator.verify_boot_files(
+                        base_url, kernel_path, initrd_path, verbose=verbose
+                    )
+                    verify_cache[cache_key] = validation_result
+                if not validation_result:
+                    logger.info("    ✗ %s: boot files not found, skipping", ipxe_arch)
+                    return None
+                logger.info("    ✓ %s: verified", ipxe_arch)
+
+            params = render_params(base_url=base_url) if render_params else ""
+
+            return BootEntry(
+                id=_make_id(dist_id, version, ipxe_arch),
+                label=label,
+                kernel_url=kernel_url,
+                initrd_url=initrd_url,
+                boot_params=params,
+                architecture=ipxe_arch,
+                version=version,
+            )
+
+        return build
 
     def _build_entry_for_arch(
         self,
@@ -93,50 +302,7 @@ class DistributionBuilder:
         Returns:
             BootEntry or None if validation fails
         """
-        # Map iPXE arch to distribution arch
-        dist_arch = arch_map.get(ipxe_arch, ipxe_arch)
-
-        # Get configuration for this architecture
-        arch_config = dist_config
-        architectures = dist_config.get("architectures")
-
-        if isinstance(architectures, dict) and ipxe_arch in architectures:
-            # Per-arch configuration overrides
-            arch_config = {**dist_config, **architectures[ipxe_arch]}
-
-        url_template = arch_config["url_template"]
-        kernel_path = arch_config["boot_files"]["kernel"]
-        initrd_path = arch_config["boot_files"]["initrd"]
-        boot_params = arch_config.get("boot_params", "")
-
-        # Format URL with version and architecture
-        base_url = url_template.format(version=version, arch=dist_arch)
-
-        # Validate URLs if requested
-        if self.validate_urls:
-            validation_result = URLValidator.verify_boot_files(
-                base_url, kernel_path, initrd_path, verbose=self.verbose
-            )
-            if not validation_result:
-                if self.verbose:
-                    print(f"    ✗ {ipxe_arch}: boot files not found, skipping")
-                return None
-            if self.verbose:
-                print(f"    ✓ {ipxe_arch}: verified")
-
-        kernel_url = f"{base_url}/{kernel_path}"
-        initrd_url = f"{base_url}/{initrd_path}"
-        params = boot_params.format(base_url=base_url) if boot_params else ""
-
-        return BootEntry(
-            id=f"{dist_id}_{version}_{ipxe_arch}".replace("-", "_").replace(".", "_"),
-            label=label,
-            kernel_url=kernel_url,
-            initrd_url=initrd_url,
-            boot_params=params,
-            architecture=ipxe_arch,
-            version=version,
-        )
+        return self._make_entry_builder(dist_id, dist_config, arch_map)(version, ipxe_arch, label)
 
     def _format_label(
         self,
@@ -163,16 +329,9 @@ class DistributionBuilder:
         # Get the architecture name to display (use distribution name if mapped)
         display_arch = arch_map.get(ipxe_arch, ipxe_arch)
 
-        parts = [dist_label, version]
-
-        if name:
-            parts.append(name)
-        elif variant:
-            parts.append(variant)
-
-        parts.append(f"({display_arch})")
-
-        return " ".join(parts)
+        # Name takes precedence over variant; empty parts are dropped
+        parts = (dist_label, version, name or variant, f"({display_arch})")
+        return " ".join(p for p in parts if p)
 
     def build_static_distribution(
         self, dist_id: str, dist_config: Dict[str, Any]
@@ -186,11 +345,16 @@ class DistributionBuilder:
         Returns:
             DistributionMenu object, or None if no valid entries
         """
-        entries = []
-
         # Get architecture mapping
         arch_map = self._get_arch_map(dist_id, dist_config)
 
+        # Cleaned display label is loop-invariant; compute it once
+        display_label = (
+            dist_config["label"].replace("Boot ", "").replace(" (multiple versions)", "")
+        )
+
+        # First materialize every (version, arch, label) task without network calls
+        tasks = []
         for version_info in dist_config["versions"]:
             version = version_info["version"]
             base_label = version_info.get("label", f"{dist_id.title()} {version}")
@@ -202,44 +366,86 @@ class DistributionBuilder:
                 # Backward compatibility: use top-level architectures or default to x86_64
                 version_architectures = self._get_architectures(dist_id, dist_config)
 
-            if self.verbose:
-                print(f"  Checking {base_label}...")
+            logger.info("  Checking %s...", base_label)
 
-            # Build entry for each architecture
             for ipxe_arch in version_architectures:
                 # Generate human-friendly label
-                label = self._format_label(
-                    dist_config["label"].replace("Boot ", "").replace(" (multiple versions)", ""),
-                    version,
-                    ipxe_arch,
-                    arch_map,
-                    name=name,
-                )
+                label = self._format_label(display_label, version, ipxe_arch, arch_map, name=name)
+                tasks.append((version, ipxe_arch, label))
 
-                # Build boot entry
-                entry = self._build_entry_for_arch(
-                    dist_id, version, label, dist_config, ipxe_arch, arch_map
-                )
+        return self._build_menu_from_tasks(dist_id, dist_config, arch_map, tasks)
+
+    def _build_menu_from_tasks(
+        self,
+        dist_id: str,
+        dist_config: Dict[str, Any],
+        arch_map: Dict[str, str],
+        tasks: List[Any],
+        trust_metadata: bool = False,
+    ) -> Optional[DistributionMenu]:
+        """Run the build pipeline shared by static and dynamic menus.
 
-                if entry:
-                    entries.append(entry)
-                    if self.verbose:
-                        print(f"    ✓ {label}")
-                else:
-                    if self.verbose:
-                        print(f"    ✗ {label} - boot files not found, skipping")
+        Builds entries for the materialized (version, arch, label) tasks
+        concurrently on the shared validation pool, collects the results
+        in task order, and assembles the DistributionMenu.
+
+        Args:
+            dist_id: Distribution identifier
+            dist_config: Distribution configuration
+            arch_map: Architecture name mapping
+            tasks: List of (version, ipxe_arch, label) tuples
+            trust_metadata: Spot-check the first entry's URLs and skip
+                validation for the rest (used for dynamic distributions
+                whose metadata already enumerates extant releases)
+
+        Returns:
+            DistributionMenu object, or None if no valid entries
+        """
+        # Validate and build entries concurrently (the work is network-bound)
+        build_entry = self._make_entry_builder(dist_id, dist_config, arch_map)
+
+        first_entry: Optional[BootEntry] = None
+        if trust_metadata and tasks:
+            first_entry = build_entry(*tasks[0])
+
+        results: List[Optional[BootEntry]]
+        if first_entry is not None:
+            logger.info(
+                "  trust_metadata: URL schema verified, skipping %d remaining probes",
+                len(tasks) - 1,
+            )
+            results = [first_entry] + [
+                build_entry(version, ipxe_arch, label, validate=False)
+                for version, ipxe_arch, label in tasks[1:]
+            ]
+        else:
+            # Full validation (also the fallback when the spot check fails;
+            # its result is memoized, so no probe is repeated)
+            futures = [
+                self._executor.submit(build_entry, version, ipxe_arch, label)
+                for version, ipxe_arch, label in tasks
+            ]
+            results = [future.result() for future in futures]
+
+        # Collect architectures as entries arrive (insertion-ordered, deduped)
+        entries = []
+        archs_seen: Dict[str, None] = {}
+        for (version, ipxe_arch, label), entry in zip(tasks, results):
+            if entry:
+                entries.append(entry)
+                archs_seen[entry.architecture] = None
+                logger.info("    ✓ %s", label)
+            else:
+                logger.info("    ✗ %s - boot files not found, skipping", label)
 
         if not entries:
             return None
 
-        # Collect all architectures used
-        all_architectures = list(set(entry.architecture for entry in entries))
-
         return DistributionMenu(
-            id=f"{dist_id}_menu",
+            id=_make_id(dist_id, "menu"),
             label=dist_config["label"],
             entries=entries,
-            architectures=all_architectures,
+            architectures=list(archs_seen),
         )
 
     def build_dynamic_distribution(
@@ -254,8 +460,6 @@ class DistributionBuilder:
         Returns:
             DistributionMenu object, or None if no valid entries
         """
-        entries = []
-
         # Get metadata provider
         metadata_provider = dist_config.get("metadata_provider")
         if not metadata_provider:
@@ -275,75 +479,103 @@ class DistributionBuilder:
         metadata_url = dist_config["metadata_url"]
         metadata_filter = dist_config.get("metadata_filter", {})
 
-        if self.verbose:
-            print(f"  Fetching metadata from {metadata_url}...")
+        logger.info("  Fetching metadata from %s...", metadata_url)
 
-        fetcher = fetcher_class()
+        fetcher = self._fetchers.get(metadata_provider)
+        if fetcher is None:
+            if self.metadata_cache_dir is not None:
+                fetcher = fetcher_class(cache_dir=self.metadata_cache_dir)
+            else:
+                fetcher = fetcher_class()
+            self._fetchers[metadata_provider] = fetcher
         version_objects = fetcher.fetch_versions(metadata_url, **metadata_filter)
 
         if not version_objects:
             print(f"  ✗ No versions found for {dist_id}", file=sys.stderr)
             return None
 
-        if self.verbose:
-            version_list = [vo["version"] for vo in version_objects]
-            print(f"  Found {len(version_objects)} versions: {', '.join(version_list)}")
+        # Normalize the fetcher's plain dicts into VersionObject instances;
+        # attribute access below is cheaper than repeated dict lookups
+        version_objects = [
+            vo
+            if isinstance(vo, VersionObject)
+            else VersionObject(
+                version=vo["version"],
+                architectures=vo["architectures"],
+                variant=vo.get("variant"),
+                name=vo.get("name"),
+            )
+            for vo in version_objects
+        ]
 
-        # Get architecture mapping
+        if logger.isEnabledFor(logging.INFO):
+            version_list = ", ".join(vo.version for vo in version_objects)
+            logger.info("  Found %d versions: %s", len(version_objects), version_list)
+
+        # Get architecture mapping, plus its inverse for metadata arch names
         arch_map = self._get_arch_map(dist_id, dist_config)
+        inverse_arch_map = {dist: ipxe for ipxe, dist in arch_map.items()}
 
-        # Build entries for each version × architecture combination
+        # First materialize every (version, arch, label) task without network calls
+        tasks = []
         for version_obj in version_objects:
-            version = version_obj["version"]
-            variant = version_obj.get("variant")
-            name = version_obj.get("name")
-            architectures = version_obj["architectures"]
-
-            if self.verbose:
-                archs_str = ", ".join(architectures)
-                print(f"  Checking {dist_config['label']} {version} ({archs_str})...")
+            version = version_obj.version
+            variant = version_obj.variant
+            name = version_obj.name
+            architectures = version_obj.architectures
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "  Checking %s %s (%s)...",
+                    dist_config["label"],
+                    version,
+                    ", ".join(architectures),
+                )
 
-            # Build entry for each architecture
             for dist_arch in architectures:
-                # Map distribution arch to iPXE arch (reverse mapping)
-                ipxe_arch = None
-                for ipxe, dist in arch_map.items():
-                    if dist == dist_arch:
-                        ipxe_arch = ipxe
-                        break
-                if not ipxe_arch:
-                    ipxe_arch = dist_arch  # Use as-is if no mapping
+                # Map distribution arch to iPXE arch (use as-is if no mapping)
+                ipxe_arch = inverse_arch_map.get(dist_arch, dist_arch)
 
                 # Generate human-friendly label
                 label = self._format_label(
                     dist_config["label"], version, ipxe_arch, arch_map, variant=variant, name=name
                 )
+                tasks.append((version, ipxe_arch, label))
 
-                # Build boot entry
-                entry = self._build_entry_for_arch(
-                    dist_id, version, label, dist_config, ipxe_arch, arch_map
-                )
+        # The metadata already enumerates extant releases authoritatively;
+        # with trust_metadata the first entry spot-checks the URL schema
+        # and the remaining entries skip their probes
+        trust_metadata = bool(dist_config.get("trust_metadata")) and self.validate_urls
 
-                if entry:
-                    entries.append(entry)
-                    if self.verbose:
-                        print(f"    ✓ {label}")
-                else:
-                    if self.verbose:
-                        print(f"    ✗ {label} - boot files not found, skipping")
+        return self._build_menu_from_tasks(
+            dist_id, dist_config, arch_map, tasks, trust_metadata=trust_metadata
+        )
 
-        if not entries:
-            return None
+    def build_all(self, distributions: Dict[str, Dict[str, Any]]) -> List[DistributionMenu]:
+        """Build menus for all distributions concurrently.
 
-        # Collect all architectures used
-        all_architectures = list(set(entry.architecture for entry in entries))
+        Distributions are independent and their cost is dominated by
+        network I/O (metadata fetches plus HEAD validation), so they are
+        fanned out on a dedicated thread pool, separate from the
+        per-entry validation pool to avoid the two levels of tasks
+        starving each other.
 
-        return DistributionMenu(
-            id=f"{dist_id}_menu",
-            label=dist_config["label"],
-            entries=entries,
-            architectures=all_architectures,
-        )
+        Args:
+            distributions: Mapping of distribution id to configuration
+
+        Returns:
+            List of DistributionMenu objects in configuration order
+            (disabled or invalid distributions are skipped)
+        """
+        if not distributions:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(8, len(distributions))) as executor:
+            futures = [
+                executor.submit(self.build_distribution, dist_id, dist_config)
+                for dist_id, dist_config in distributions.items()
+            ]
+            return [menu for menu in (future.result() for future in futures) if menu]
 
     def build_distribution(
         self, dist_id: str, dist_config: Dict[str, Any]
@@ -358,8 +590,7 @@ class DistributionBuilder:
             DistributionMenu object, or None if disabled or invalid
         """
         if not dist_config.get("enabled", True):
-            if self.verbose:
-                print("  ⊘ Skipped (disabled)")
+            logger.info("  ⊘ Skipped (disabled)")
             return None
 
         dist_type = dist_config.get("type", "static")
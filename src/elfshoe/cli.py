@@ -1,16 +1,11 @@
 """Command-line interface for iPXE Menu Generator."""
 
 import argparse
+import logging
 import sys
 from pathlib import Path
 from typing import Any, Dict
 
-try:
-    import yaml
-except ImportError:
-    print("Error: PyYAML is required. Install with: pip install pyyaml", file=sys.stderr)
-    sys.exit(1)
-
 from .builder import DistributionBuilder
 from .core import MenuGenerator, URLValidator
 from .validator import validate_and_report
@@ -25,9 +20,22 @@ def load_config(config_path: Path) -> Dict[str, Any]:
     Returns:
         Configuration dictionary
     """
+    # Imported here so --help/--version runs don't pay the YAML import cost
+    try:
+        import yaml
+
+        try:
+            # libyaml C backend parses several times faster than pure Python
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+    except ImportError:
+        print("Error: PyYAML is required. Install with: pip install pyyaml", file=sys.stderr)
+        sys.exit(1)
+
     try:
         with open(config_path) as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
     except Exception as e:
         print(f"Error loading config: {e}", file=sys.stderr)
         sys.exit(1)
@@ -67,6 +75,16 @@ Examples:
         action="store_true",
         help="Skip URL validation (faster but may include broken links)",
     )
+    parser.add_argument(
+        "--url-cache",
+        action="store_true",
+        help="Cache URL check results on disk for 24h (speeds up repeated runs)",
+    )
+    parser.add_argument(
+        "--metadata-cache",
+        action="store_true",
+        help="Cache distribution metadata on disk and revalidate with conditional requests",
+    )
     parser.add_argument("-q", "--quiet", action="store_true", help="Minimal output")
     parser.add_argument("--version", action="version", version="%(prog)s 2.0.0")
 
@@ -80,22 +98,40 @@ Examples:
     config = load_config(args.config)
     verbose = not args.quiet
 
+    # Builder progress goes through logging; only the level is decided here
+    logging.basicConfig(
+        level=logging.INFO if verbose else logging.WARNING,
+        format="%(message)s",
+        stream=sys.stdout,
+    )
+
+    if args.url_cache:
+        URLValidator.enable_cache(Path.home() / ".cache" / "elfshoe" / "url-cache.json")
+
     # Build distribution menus
     if verbose:
         print("Building distribution menus...")
 
-    builder = DistributionBuilder(config, validate_urls=not args.no_validate, verbose=verbose)
-    menus = []
+    metadata_cache_dir = None
+    if args.metadata_cache:
+        metadata_cache_dir = Path.home() / ".cache" / "elfshoe" / "metadata"
 
-    for dist_id, dist_config in config.get("distributions", {}).items():
-        if verbose:
-            print(f"\nProcessing {dist_id}...")
+    builder = DistributionBuilder(
+        config,
+        validate_urls=not args.no_validate,
+        verbose=verbose,
+        metadata_cache_dir=metadata_cache_dir,
+    )
+
+    # Distributions are independent; build_all overlaps their network I/O
+    menus = builder.build_all(config.get("distributions", {}))
+
+    if verbose:
+        for menu in menus:
+            print(f"  ✓ {menu.label}: {len(menu.entries)} entries")
 
-        menu = builder.build_distribution(dist_id, dist_config)
-        if menu:
-            menus.append(menu)
-            if verbose:
-                print(f"  ✓ Generated menu with {len(menu.entries)} entries")
+    if args.url_cache:
+        URLValidator.save_cache()
 
     if not menus:
         print("Warning: No distribution menus generated", file=sys.stderr)
@@ -105,12 +141,11 @@ Examples:
         print("\nGenerating menu file...")
 
     generator = MenuGenerator(config)
-    menu_content = generator.generate(menus)
 
-    # Write output
+    # Write output (streamed straight from the template)
     try:
         with open(args.output, "w") as f:
-            f.write(menu_content)
+            generator.generate_to(menus, f)
 
         if verbose:
             print(f"✓ Menu generated successfully: {args.output}")
@@ -1,9 +1,8 @@
 """Menu generation using Jinja2 templates."""
 
+import io
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import Any, Dict, List, Optional, TextIO
 
 from .models import DistributionMenu
 
@@ -18,6 +17,10 @@ class MenuGenerator:
             config: Configuration dictionary
             template_dir: Path to templates directory (defaults to src/templates)
         """
+        # Imported here so CLI runs that exit before rendering (--help,
+        # --version, config errors) don't pay the Jinja2 import cost
+        from jinja2 import Environment, FileSystemLoader
+
         self.config = config
 
         # Set up Jinja2 environment
@@ -27,19 +30,25 @@ class MenuGenerator:
 
         self.env = Environment(
             loader=FileSystemLoader(template_dir),
-            autoescape=select_autoescape(["html", "xml"]),
+            # iPXE scripts are plain text; HTML autoescape never applies
+            # and every variable render would pay its check
+            autoescape=False,
             trim_blocks=True,
             lstrip_blocks=True,
         )
 
-    def generate(self, menus: List[DistributionMenu]) -> str:
-        """Generate complete iPXE menu using templates.
+        # Compiled once; get_template parses and compiles on first use and
+        # repeated generate calls shouldn't repeat the cache lookup either
+        self._main_template = self.env.get_template("main_menu.ipxe.j2")
+
+    def _template_context(self, menus: List[DistributionMenu]) -> Dict[str, Any]:
+        """Build the render context for the main menu template.
 
         Args:
             menus: List of distribution menus to include
 
         Returns:
-            Generated iPXE menu as string
+            Keyword arguments for the template render
         """
         # Prepare menu configuration
         menu_config = self.config.get("menu", {})
@@ -52,38 +61,40 @@ class MenuGenerator:
         # Get error timeout (defaults to main timeout if not set)
         error_timeout = menu_config.get("error_timeout", menu_config.get("timeout", 30000))
 
-        # Convert distribution menus to dicts for template
-        distributions_data = []
-        for menu in menus:
-            dist_dict = {
-                "id": menu.id,
-                "label": menu.label,
-                "architectures": menu.architectures,
-                "entries": [
-                    {
-                        "id": entry.id,
-                        "label": entry.label,
-                        "kernel_url": entry.kernel_url,
-                        "initrd_url": entry.initrd_url,
-                        "boot_params": entry.boot_params,
-                        "architecture": entry.architecture,  # Include architecture
-                        "arch_urls": entry.arch_urls,  # Include multi-arch URLs (legacy)
-                    }
-                    for entry in menu.entries
-                ],
-            }
-            distributions_data.append(dist_dict)
-
         # Get additional items
         additional_items = self.config.get("additional_items", [])
 
-        # Render main template
-        template = self.env.get_template("main_menu.ipxe.j2")
-        output = template.render(
-            menu=menu_data,
-            distributions=distributions_data,
-            additional_items=additional_items,
-            error_timeout=error_timeout,
-        )
+        # The templates use attribute access only, so DistributionMenu and
+        # BootEntry dataclasses are passed straight through - no per-entry
+        # dict copies
+        return {
+            "menu": menu_data,
+            "distributions": menus,
+            "additional_items": additional_items,
+            "error_timeout": error_timeout,
+        }
+
+    def generate_to(self, menus: List[DistributionMenu], fileobj: TextIO) -> None:
+        """Render the iPXE menu directly into a file object.
+
+        Streams the template output chunk by chunk instead of
+        materializing the full menu as one string first.
+
+        Args:
+            menus: List of distribution menus to include
+            fileobj: Writable text file object
+        """
+        self._main_template.stream(**self._template_context(menus)).dump(fileobj)
+
+    def generate(self, menus: List[DistributionMenu]) -> str:
+        """Generate complete iPXE menu using templates.
 
-        return output
+        Args:
+            menus: List of distribution menus to include
+
+        Returns:
+            Generated iPXE menu as string
+        """
+        buffer = io.StringIO()
+        self.generate_to(menus, buffer)
+        return buffer.getvalue()
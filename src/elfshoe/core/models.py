@@ -1,8 +1,13 @@
 """Core data models for iPXE menu generation."""
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
+# dataclass(slots=True) only exists on 3.10+; older interpreters get
+# ordinary frozen dataclasses instead of failing at import time
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # Architecture constants - iPXE buildarch values
 ARCH_X86_64 = "x86_64"
 ARCH_I386 = "i386"
@@ -18,7 +23,7 @@ DEFAULT_ARCH_MAPS = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class VersionObject:
     """Represents a distribution version with supported architectures."""
 
@@ -28,7 +33,7 @@ class VersionObject:
     name: Optional[str] = None  # e.g., "Bookworm" for Debian
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class BootEntry:
     """Represents a single boot entry for a specific version and architecture."""
 
@@ -42,9 +47,20 @@ class BootEntry:
     variant: Optional[str] = None  # Variant (e.g., "Server")
     # For multi-arch entries: map arch -> URLs
     arch_urls: Optional[Dict[str, Dict[str, str]]] = None  # arch -> {kernel, initrd}
+    # Local initrd filename passed to the kernel; derived from initrd_url
+    initrd_name: str = ""
+
+    def __post_init__(self):
+        if not self.initrd_name:
+            # object.__setattr__ because the dataclass is frozen
+            object.__setattr__(
+                self,
+                "initrd_name",
+                "initrd.img" if self.initrd_url.endswith(".img") else "initrd.gz",
+            )
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class DistributionMenu:
     """Represents a distribution submenu."""
 
@@ -1,7 +1,13 @@
 """URL validation utilities."""
 
+import json
 import sys
+import time
+import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 # ANSI color codes
 RED = "\033[91m"
@@ -14,6 +20,43 @@ class URLValidator:
 
     https_redirect_detected = False
 
+    # Optional persistent cache of check results (see enable_cache)
+    _cache: Optional[Dict[str, Any]] = None
+    _cache_path: Optional[Path] = None
+    _cache_ttl: int = 0
+
+    @classmethod
+    def enable_cache(cls, cache_path: Path, ttl: int = 86400) -> None:
+        """Enable the persistent on-disk cache of URL check results.
+
+        Repeated runs usually probe the same kernel/initrd URLs; with the
+        cache enabled, results younger than ttl are reused without any
+        network traffic. Disabled by default.
+
+        Args:
+            cache_path: JSON file holding cached results
+            ttl: Seconds a cached result stays valid
+        """
+        cls._cache_path = Path(cache_path)
+        cls._cache_ttl = ttl
+        try:
+            with open(cls._cache_path) as f:
+                cls._cache = json.load(f)
+        except (OSError, ValueError):
+            cls._cache = {}
+
+    @classmethod
+    def save_cache(cls) -> None:
+        """Write the URL check cache back to disk (no-op if not enabled)."""
+        if cls._cache is None or cls._cache_path is None:
+            return
+        try:
+            cls._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cls._cache_path, "w") as f:
+                json.dump(cls._cache, f)
+        except OSError as e:
+            print(f"{YELLOW}  ⚠ Could not save URL cache: {e}{RESET}", file=sys.stderr)
+
     @staticmethod
     def check_url(url: str, timeout: int = 10, verbose: bool = True) -> bool:
         """Check if a URL is accessible.
@@ -26,24 +69,93 @@ class URLValidator:
         Returns:
             True if URL is accessible (200 status), False otherwise
         """
+        cache = URLValidator._cache
+        if cache is not None:
+            cached = cache.get(url)
+            if cached is not None and time.time() - cached["checked_at"] < URLValidator._cache_ttl:
+                return cached["ok"]
+
+        ok = False
         try:
-            req = urllib.request.Request(url, method="HEAD")
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                final_url = response.geturl()
-                if url.startswith("http://") and final_url.startswith("https://"):
-                    URLValidator.https_redirect_detected = True
-                    if verbose:
-                        print(
-                            f"{RED}  ✗ CRITICAL: URL {url} redirects to HTTPS ({final_url}).\n"
-                            f"    Standard iPXE builds do NOT support HTTPS!{RESET}",
-                            file=sys.stderr,
-                        )
-                    return False
-                return response.status == 200
+            try:
+                req = urllib.request.Request(url, method="HEAD")
+                with urllib.request.urlopen(req, timeout=timeout) as response:
+                    result = URLValidator._check_response(url, response, verbose)
+            except urllib.error.HTTPError as e:
+                if e.code not in (403, 405, 501):
+                    raise
+                # Some mirrors reject HEAD outright; a 1-byte ranged GET
+                # verifies existence almost as cheaply
+                req = urllib.request.Request(url, headers={"Range": "bytes=0-0"})
+                with urllib.request.urlopen(req, timeout=timeout) as response:
+                    result = URLValidator._check_response(url, response, verbose)
+            if result is None:
+                # HTTPS redirect; not cached so the flag trips on every run
+                return False
+            ok = result
         except Exception as e:
             if verbose:
                 print(f"{YELLOW}  ✗ Failed to access {url}: {e}{RESET}", file=sys.stderr)
-            return False
+
+        if cache is not None:
+            cache[url] = {"ok": ok, "checked_at": time.time()}
+        return ok
+
+    @staticmethod
+    def _check_response(url: str, response: Any, verbose: bool) -> Optional[bool]:
+        """Evaluate a probe response for one URL.
+
+        Args:
+            url: URL that was requested
+            response: Open urllib response
+            verbose: Print error messages if True
+
+        Returns:
+            True/False for accessible or not, None on an HTTP-to-HTTPS
+            redirect (which iPXE cannot follow)
+        """
+        # Only http URLs can redirect to HTTPS; skip geturl() for the rest
+        if url.startswith("http://"):
+            final_url = response.geturl()
+            if final_url.startswith("https://"):
+                URLValidator.https_redirect_detected = True
+                if verbose:
+                    print(
+                        f"{RED}  ✗ CRITICAL: URL {url} redirects to HTTPS ({final_url}).\n"
+                        f"    Standard iPXE builds do NOT support HTTPS!{RESET}",
+                        file=sys.stderr,
+                    )
+                return None
+        # 206 Partial Content is the success status for ranged GETs
+        return response.status in (200, 206)
+
+    @staticmethod
+    def check_urls(
+        urls: List[str], timeout: int = 10, verbose: bool = True, max_workers: int = 8
+    ) -> Dict[str, bool]:
+        """Check several URLs concurrently.
+
+        HEAD probes are network-bound, so a batch is fanned out on a
+        thread pool rather than checked one after another.
+
+        Args:
+            urls: URLs to check
+            timeout: Request timeout in seconds (per URL)
+            verbose: Print error messages if True
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Dict mapping each URL to its check_url result
+        """
+        if not urls:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            results = executor.map(
+                lambda url: URLValidator.check_url(url, timeout=timeout, verbose=verbose),
+                urls,
+            )
+            return dict(zip(urls, results))
 
     @staticmethod
     def verify_boot_files(
@@ -60,10 +172,24 @@ class URLValidator:
         Returns:
             True if both files exist, False otherwise
         """
-        kernel_url = f"{base_url}/{kernel_path}"
-        initrd_url = f"{base_url}/{initrd_path}"
+        return URLValidator.verify_urls(
+            f"{base_url}/{kernel_path}", f"{base_url}/{initrd_path}", verbose=verbose
+        )
+
+    @staticmethod
+    def verify_urls(kernel_url: str, initrd_url: str, verbose: bool = True) -> bool:
+        """Verify prebuilt kernel and initrd URLs.
 
-        kernel_ok = URLValidator.check_url(kernel_url, verbose=verbose)
-        initrd_ok = URLValidator.check_url(initrd_url, verbose=verbose)
+        Args:
+            kernel_url: Full URL of the kernel file
+            initrd_url: Full URL of the initrd file
+            verbose: Print status messages if True
 
-        return kernel_ok and initrd_ok
+        Returns:
+            True if both files exist, False otherwise
+        """
+        # A missing kernel already disqualifies the entry; don't waste a
+        # round trip probing the initrd as well
+        if not URLValidator.check_url(kernel_url, verbose=verbose):
+            return False
+        return URLValidator.check_url(initrd_url, verbose=verbose)
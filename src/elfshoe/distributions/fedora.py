@@ -1,10 +1,20 @@
 """Fedora metadata fetcher."""
 
+import gzip
+import hashlib
 import json
 import sys
+import urllib.error
 import urllib.request
-from collections import defaultdict
-from typing import Dict, List, Set
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+try:
+    # Optional accelerator (install with the 'perf' extra): parses raw
+    # bytes directly and is several times faster on large payloads
+    import orjson
+except ImportError:
+    orjson = None
 
 from .base import AbstractMetadataFetcher
 
@@ -12,10 +22,52 @@ from .base import AbstractMetadataFetcher
 class FedoraMetadataFetcher(AbstractMetadataFetcher):
     """Fetches Fedora release metadata from releases.json."""
 
-    def __init__(self):
-        """Initialize fetcher with cache."""
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize fetcher with cache.
+
+        Args:
+            cache_dir: Optional directory for a persistent metadata cache.
+                When set, releases.json is stored on disk with its
+                ETag/Last-Modified validators and refetched with a
+                conditional GET, so unchanged metadata costs a 304
+                instead of a full download and parse.
+        """
         self._cache = None  # Cache the metadata to avoid multiple fetches
         self._cache_url = None
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        # variant -> version -> set(arch), derived lazily from the parsed
+        # metadata and keyed by identity so it rebuilds when data changes
+        self._index: Optional[Dict[str, Dict[str, Set[str]]]] = None
+        self._index_source: Optional[List[Dict]] = None
+        # variant -> newest-first version list, reset with the index
+        self._sorted_versions: Dict[str, List[str]] = {}
+
+    def _cache_file(self, metadata_url: str) -> Path:
+        """Return the on-disk cache path for a metadata URL."""
+        digest = hashlib.blake2b(metadata_url.encode(), digest_size=8).hexdigest()
+        return self._cache_dir / f"fedora-{digest}.json"
+
+    def _load_disk_cache(self, metadata_url: str) -> Optional[Dict]:
+        """Load the cached document for a URL, or None if absent/corrupt."""
+        try:
+            with open(self._cache_file(metadata_url)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _store_disk_cache(self, metadata_url: str, response, data: List[Dict]) -> None:
+        """Write fetched metadata plus its cache validators to disk."""
+        document = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "data": data,
+        }
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_file(metadata_url), "w") as f:
+                json.dump(document, f)
+        except (OSError, TypeError):
+            pass  # The cache is best-effort; the fetch already succeeded
 
     def _fetch_metadata(self, metadata_url: str) -> List[Dict]:
         """Fetch and cache metadata.
@@ -30,15 +82,96 @@ class FedoraMetadataFetcher(AbstractMetadataFetcher):
         if self._cache is not None and self._cache_url == metadata_url:
             return self._cache
 
+        cached = self._load_disk_cache(metadata_url) if self._cache_dir else None
+
         try:
-            with urllib.request.urlopen(metadata_url, timeout=10) as response:
-                self._cache = json.loads(response.read().decode())
-                self._cache_url = metadata_url
-                return self._cache
+            # releases.json compresses ~10x; ask for gzip on the wire
+            headers = {"Accept-Encoding": "gzip"}
+            if cached is not None:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+            req = urllib.request.Request(metadata_url, headers=headers)
+            try:
+                with urllib.request.urlopen(req, timeout=10) as response:
+                    raw = response.read()
+                    if response.headers.get("Content-Encoding") == "gzip":
+                        raw = gzip.decompress(raw)
+                    # Both parsers accept bytes; no intermediate str decode
+                    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                    if self._cache_dir:
+                        self._store_disk_cache(metadata_url, response, data)
+            except urllib.error.HTTPError as e:
+                if cached is None or e.code != 304:
+                    raise
+                # Metadata unchanged upstream; serve the on-disk copy
+                data = cached["data"]
+            self._cache = data
+            self._cache_url = metadata_url
+            return data
         except Exception as e:
             print(f"  ✗ Failed to fetch Fedora metadata: {e}", file=sys.stderr)
             return []
 
+    def _variant_index(self, data: List[Dict]) -> Dict[str, Dict[str, Set[str]]]:
+        """Index releases as variant -> version -> set of architectures.
+
+        Built in a single pass over the release list and memoized against
+        the parsed data, so fetch_versions and get_version_architectures
+        share one scan instead of each walking the full list.
+
+        Args:
+            data: Parsed releases.json entries
+
+        Returns:
+            Nested mapping of variant to version to architecture set
+        """
+        if self._index is None or self._index_source is not data:
+            index: Dict[str, Dict[str, Set[str]]] = {}
+            for release in data:
+                variant = release.get("variant")
+                if variant is None:
+                    continue
+                versions = index.get(variant)
+                if versions is None:
+                    versions = index[variant] = {}
+                archs = versions.get(release["version"])
+                if archs is None:
+                    archs = versions[release["version"]] = set()
+                archs.add(release["arch"])
+            self._index = index
+            self._index_source = data
+            self._sorted_versions = {}
+        return self._index
+
+    def _sorted_variant_versions(self, data: List[Dict], variant: str) -> List[str]:
+        """Return a variant's versions sorted newest-first, memoized.
+
+        fetch_versions may be called several times against one metadata
+        document (e.g. with different architecture filters); the
+        int-keyed sort runs once per variant instead of per call.
+
+        Args:
+            data: Parsed releases.json entries
+            variant: Variant name (e.g., "Server")
+
+        Returns:
+            Version strings in descending numeric order, with any
+            non-numeric versions (e.g. "Rawhide") sorted last
+        """
+        index = self._variant_index(data)  # resets the sort cache on rebuild
+        versions = self._sorted_versions.get(variant)
+        if versions is None:
+            # Decorate once instead of casting in a key function; non-numeric
+            # versions get key -1 so they sort after every release number
+            # rather than raising ValueError
+            typed = [(int(v) if v.isdigit() else -1, v) for v in index.get(variant, ())]
+            typed.sort(reverse=True)
+            versions = [v for _, v in typed]
+            self._sorted_versions[variant] = versions
+        return versions
+
     def fetch_versions(self, metadata_url: str, **filters) -> List[Dict]:
         """Fetch Fedora versions from releases.json as version objects.
 
@@ -56,18 +189,11 @@ class FedoraMetadataFetcher(AbstractMetadataFetcher):
         variant = filters.get("variant", "Server")
         requested_archs = filters.get("architectures")  # Optional filter
         data = self._fetch_metadata(metadata_url)
-
-        # Group architectures by version
-        version_archs = defaultdict(set)
-        for release in data:
-            if release.get("variant") == variant:
-                version = release["version"]
-                arch = release["arch"]
-                version_archs[version].add(arch)
+        version_archs = self._variant_index(data).get(variant, {})
 
         # Build version objects
         version_objects = []
-        for version in sorted(version_archs.keys(), key=int, reverse=True):
+        for version in self._sorted_variant_versions(data, variant):
             available_archs = version_archs[version]
 
             # Filter architectures if requested
@@ -99,13 +225,7 @@ class FedoraMetadataFetcher(AbstractMetadataFetcher):
             Example: {'43': {'x86_64', 'aarch64', 'ppc64le', 's390x'}}
         """
         data = self._fetch_metadata(metadata_url)
+        version_archs = self._variant_index(data).get(variant, {})
 
-        # Group architectures by version
-        version_archs = defaultdict(set)
-        for release in data:
-            if release.get("variant") == variant:
-                version = release["version"]
-                arch = release["arch"]
-                version_archs[version].add(arch)
-
-        return dict(version_archs)
+        # Copy the sets so callers cannot mutate the shared index
+        return {version: set(archs) for version, archs in version_archs.items()}
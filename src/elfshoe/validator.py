@@ -3,9 +3,44 @@
 Validates generated iPXE scripts for common syntax errors.
 """
 
+import hashlib
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+# Files below this count are validated serially; worker processes only
+# pay off once there is enough parsing to spread across cores
+_PARALLEL_MIN_FILES = 4
+
+# Valid iPXE commands; shared across all validator instances
+_KNOWN_COMMANDS = frozenset(
+    {
+        "menu",
+        "item",
+        "choose",
+        "goto",
+        "chain",
+        "kernel",
+        "initrd",
+        "boot",
+        "set",
+        "echo",
+        "dhcp",
+        "shell",
+        "exit",
+        "sleep",
+        "sanboot",
+        "imgfree",
+        "imgload",
+        "prompt",
+        "read",
+        "isset",
+        "iseq",  # Compare strings/variables
+        "inc",
+        "dec",
+    }
+)
 
 
 class ValidationError:
@@ -40,122 +75,89 @@ class IPXEValidator:
         self.errors = []
         self.warnings = []
 
+        # One read plus a C-level split; readlines() allocates line by line
         with open(script_path) as f:
-            lines = f.readlines()
+            lines = f.read().splitlines()
 
-        self._check_shebang(lines)
-        self._check_menu_balance(lines)
-        self._check_labels(lines)
-        self._check_commands(lines)
-
-        return len(self.errors) == 0, self.errors, self.warnings
-
-    def _check_shebang(self, lines: List[str]):
-        """Check for valid iPXE shebang."""
         if not lines:
             self.errors.append(ValidationError(0, "Empty file"))
-            return
+            return False, self.errors, self.warnings
 
         if not lines[0].strip().startswith("#!ipxe"):
             self.errors.append(ValidationError(1, "Missing or invalid #!ipxe shebang"))
 
-    def _check_menu_balance(self, lines: List[str]):
-        """Check that all menus have corresponding choose statements."""
-        menu_count = sum(1 for line in lines if line.strip().startswith("menu "))
-        choose_count = sum(1 for line in lines if line.strip().startswith("choose "))
+        self._scan_lines(lines)
 
-        if menu_count != choose_count:
-            self.warnings.append(
-                ValidationError(
-                    0,
-                    f"Unbalanced menus: {menu_count} menu statements, "
-                    f"{choose_count} choose statements",
-                )
-            )
+        return len(self.errors) == 0, self.errors, self.warnings
 
-    def _check_labels(self, lines: List[str]):
-        """Check for undefined label references."""
-        # Collect all defined labels
+    def _scan_lines(self, lines: List[str]):
+        """Classify every line in a single pass.
+
+        One traversal collects label definitions, goto references,
+        menu/choose counts, and unknown-command warnings; the separate
+        per-check passes each stripped and prefix-tested every line
+        again. Goto targets are resolved after the pass so forward
+        references work.
+        """
         labels = set()
+        goto_refs = []  # (line_num, target), checked once all labels are known
+        menu_count = 0
+        choose_count = 0
+
         for i, line in enumerate(lines, 1):
             stripped = line.strip()
-            if stripped.startswith(":") and not stripped.startswith("::"):
-                # Extract label name (everything after :)
-                label = stripped[1:].split()[0] if stripped[1:].split() else ""
-                if label:
-                    labels.add(label)
 
-        # Check goto targets
-        for i, line in enumerate(lines, 1):
-            if " goto " in line or line.strip().startswith("goto "):
-                # Extract everything after 'goto '
-                goto_pos = line.find("goto ")
+            # Skip empty lines and comments
+            if not stripped or stripped.startswith("#"):
+                continue
+
+            # Label definition; split(None, 1) stops after the first token
+            if stripped.startswith(":"):
+                if not stripped.startswith("::"):
+                    parts = stripped[1:].split(None, 1)
+                    if parts:
+                        labels.add(parts[0])
+                continue
+
+            first_word = stripped.split(None, 1)[0]
+            if first_word == "menu":
+                menu_count += 1
+            elif first_word == "choose":
+                choose_count += 1
+            if first_word not in _KNOWN_COMMANDS:
+                # Could be a typo or unknown command
+                self.warnings.append(
+                    ValidationError(i, f"Unknown or potentially misspelled command: '{first_word}'")
+                )
+
+            # goto may appear mid-line (e.g. 'chain ... || goto error')
+            if first_word == "goto" or " goto " in stripped:
+                goto_pos = stripped.find("goto ")
                 if goto_pos == -1:
                     continue
 
-                after_goto = line[goto_pos + 5 :].strip()
+                after_goto = stripped[goto_pos + 5 :].strip()
                 if not after_goto:
                     continue
 
-                # Get first token (the target)
-                target = after_goto.split()[0] if after_goto.split() else ""
+                target = after_goto.split(None, 1)[0]
 
                 # Skip variable references: ${var}, $var, or any string containing $
-                if "$" in target or "{" in target:
-                    continue
-
-                # Check if label exists
-                if target and target not in labels:
-                    self.errors.append(
-                        ValidationError(i, f"Reference to undefined label: '{target}'")
-                    )
-
-    def _check_commands(self, lines: List[str]):
-        """Check for common command syntax errors."""
-        known_commands = {
-            "menu",
-            "item",
-            "choose",
-            "goto",
-            "chain",
-            "kernel",
-            "initrd",
-            "boot",
-            "set",
-            "echo",
-            "dhcp",
-            "shell",
-            "exit",
-            "sleep",
-            "sanboot",
-            "imgfree",
-            "imgload",
-            "prompt",
-            "read",
-            "isset",
-            "iseq",  # Compare strings/variables
-            "inc",
-            "dec",
-        }
-
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
+                if "$" not in target and "{" not in target:
+                    goto_refs.append((i, target))
 
-            # Skip comments and labels
-            if stripped.startswith("#") or stripped.startswith(":"):
-                continue
-
-            # Skip empty lines
-            if not stripped:
-                continue
-
-            # Check if line starts with known command
-            first_word = stripped.split()[0] if stripped.split() else ""
-            if first_word and first_word not in known_commands:
-                # Could be a typo or unknown command
-                self.warnings.append(
-                    ValidationError(i, f"Unknown or potentially misspelled command: '{first_word}'")
+        if menu_count != choose_count:
+            self.warnings.append(
+                ValidationError(
+                    0,
+                    f"Unbalanced menus: {menu_count} menu statements, "
+                    f"{choose_count} choose statements",
                 )
+            )
+
+        for i, target in goto_refs:
+            if target not in labels:
+                self.errors.append(ValidationError(i, f"Reference to undefined label: '{target}'"))
 
 
 def validate_and_report(script_path: Path, *, strict: bool = False, quiet: bool = False) -> bool:
@@ -196,11 +198,28 @@ def validate_and_report(script_path: Path, *, strict: bool = False, quiet: bool
     return True
 
 
+def _validate_one(
+    script_path: Path,
+) -> Tuple[bool, List[ValidationError], List[ValidationError]]:
+    """Validate a single script (module-level so it pickles to worker processes).
+
+    Args:
+        script_path: Path to iPXE script file
+
+    Returns:
+        Tuple of (is_valid, errors, warnings)
+    """
+    return IPXEValidator().validate_file(script_path)
+
+
 def validate_multiple_files(
     file_paths: List[Path], *, strict: bool = False, quiet: bool = False
 ) -> bool:
     """Validate multiple iPXE script files and report aggregate results.
 
+    Files are independent, so large batches are validated across a
+    process pool; results are still reported in input order.
+
     Args:
         file_paths: List of paths to iPXE script files
         strict: Treat warnings as errors
@@ -209,45 +228,71 @@ def validate_multiple_files(
     Returns:
         True if all files passed validation
     """
-    validator = IPXEValidator()
     all_valid = True
     total_errors = 0
     total_warnings = 0
 
+    to_validate = [path for path in file_paths if path.exists()]
+
+    # Identical content (regenerated bundles, CI copies) is validated once;
+    # blake2b is the fastest collision-safe hash in hashlib
+    digests = {
+        path: hashlib.blake2b(path.read_bytes(), digest_size=16).digest() for path in to_validate
+    }
+    unique: Dict[bytes, Path] = {}
+    for path in to_validate:
+        unique.setdefault(digests[path], path)
+    representatives = list(unique.values())
+
+    if len(representatives) >= _PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            rep_results = dict(zip(representatives, executor.map(_validate_one, representatives)))
+    else:
+        rep_results = {path: _validate_one(path) for path in representatives}
+
+    by_digest = {digests[path]: result for path, result in rep_results.items()}
+    results: Dict[Path, Tuple[bool, List[ValidationError], List[ValidationError]]] = {
+        path: by_digest[digests[path]] for path in to_validate
+    }
+
+    # Collect the whole report and emit it with one write; a print per
+    # error means a lock acquire and flush per line
+    out_lines: List[str] = []
+
     for script_path in file_paths:
-        if not script_path.exists():
+        if script_path not in results:
             print(f"Error: File not found: {script_path}", file=sys.stderr)
             all_valid = False
             continue
 
-        is_valid, errors, warnings = validator.validate_file(script_path)
+        is_valid, errors, warnings = results[script_path]
 
-        # Print results
         if errors:
-            print(f"\n❌ {script_path}: FAILED")
-            for error in errors:
-                print(f"  {error}")
+            out_lines.append(f"\n❌ {script_path}: FAILED")
+            out_lines.extend(f"  {error}" for error in errors)
             total_errors += len(errors)
             all_valid = False
         elif warnings:
             if not quiet:
-                print(f"\n⚠️  {script_path}: WARNINGS")
-                for warning in warnings:
-                    print(f"  {warning}")
+                out_lines.append(f"\n⚠️  {script_path}: WARNINGS")
+                out_lines.extend(f"  {warning}" for warning in warnings)
             total_warnings += len(warnings)
             if strict:
                 all_valid = False
         else:
             if not quiet:
-                print(f"✓ {script_path}: OK")
+                out_lines.append(f"✓ {script_path}: OK")
 
     # Summary
     if len(file_paths) > 1 and not quiet:
-        print("\n" + "=" * 60)
-        print(f"Validated {len(file_paths)} file(s)")
+        out_lines.append("\n" + "=" * 60)
+        out_lines.append(f"Validated {len(file_paths)} file(s)")
         if total_errors:
-            print(f"  Errors: {total_errors}")
+            out_lines.append(f"  Errors: {total_errors}")
         if total_warnings:
-            print(f"  Warnings: {total_warnings}")
+            out_lines.append(f"  Warnings: {total_warnings}")
+
+    if out_lines:
+        sys.stdout.write("\n".join(out_lines) + "\n")
 
     return all_valid
@@ -352,6 +352,46 @@ class TestDistributionBuilder:
         assert len(menu.entries) == 1
         mock_fetcher_instance.fetch_versions.assert_called_once()
 
+    @patch("elfshoe.builder.get_metadata_fetcher")
+    @patch("elfshoe.builder.URLValidator.verify_boot_files")
+    def test_build_dynamic_distribution_trust_metadata(
+        self, mock_verify, mock_get_fetcher, dynamic_config
+    ):
+        """Test trust_metadata validates only the first entry."""
+        mock_verify.return_value = True
+
+        mock_fetcher_instance = MagicMock()
+        mock_fetcher_instance.fetch_versions.return_value = [
+            {"version": "40", "variant": "Server", "architectures": [ARCH_X86_64]},
+            {"version": "39", "variant": "Server", "architectures": [ARCH_X86_64]},
+        ]
+        mock_get_fetcher.return_value = MagicMock(return_value=mock_fetcher_instance)
+
+        dynamic_config["trust_metadata"] = True
+        builder = DistributionBuilder({}, validate_urls=True, verbose=False)
+        menu = builder.build_dynamic_distribution("fedora", dynamic_config)
+
+        assert menu is not None
+        assert len(menu.entries) == 2
+        mock_verify.assert_called_once()  # only the first entry is probed
+
+    @patch("elfshoe.builder.get_metadata_fetcher")
+    def test_build_dynamic_distribution_metadata_cache_dir(
+        self, mock_get_fetcher, dynamic_config, temp_dir
+    ):
+        """Test metadata_cache_dir is forwarded to the fetcher."""
+        mock_fetcher_instance = MagicMock()
+        mock_fetcher_instance.fetch_versions.return_value = []
+        mock_fetcher_class = MagicMock(return_value=mock_fetcher_instance)
+        mock_get_fetcher.return_value = mock_fetcher_class
+
+        builder = DistributionBuilder(
+            {}, validate_urls=False, verbose=False, metadata_cache_dir=temp_dir
+        )
+        builder.build_dynamic_distribution("fedora", dynamic_config)
+
+        mock_fetcher_class.assert_called_once_with(cache_dir=temp_dir)
+
     @patch("elfshoe.builder.get_metadata_fetcher")
     def test_build_dynamic_distribution_no_provider(self, mock_get_fetcher):
         """Test build_dynamic_distribution without metadata_provider."""
@@ -432,6 +472,34 @@ class TestDistributionBuilder:
 
         assert menu is None
 
+    @patch("elfshoe.builder.URLValidator.verify_boot_files")
+    def test_build_all_multiple_distributions(self, mock_verify, basic_static_config):
+        """Test build_all builds every distribution in configuration order."""
+        mock_verify.return_value = True
+        other_config = dict(basic_static_config, label="Other Distribution")
+        builder = DistributionBuilder({}, validate_urls=True, verbose=False)
+
+        menus = builder.build_all({"test": basic_static_config, "other": other_config})
+
+        assert [menu.id for menu in menus] == ["test_menu", "other_menu"]
+
+    @patch("elfshoe.builder.URLValidator.verify_boot_files")
+    def test_build_all_skips_disabled(self, mock_verify, basic_static_config):
+        """Test build_all skips disabled distributions."""
+        mock_verify.return_value = True
+        disabled_config = dict(basic_static_config, enabled=False)
+        builder = DistributionBuilder({}, validate_urls=True, verbose=False)
+
+        menus = builder.build_all({"test": basic_static_config, "off": disabled_config})
+
+        assert [menu.id for menu in menus] == ["test_menu"]
+
+    def test_build_all_empty(self):
+        """Test build_all with no distributions."""
+        builder = DistributionBuilder({}, validate_urls=False, verbose=False)
+
+        assert builder.build_all({}) == []
+
     def test_build_distribution_default_type(self, basic_static_config):
         """Test build_distribution defaults to static type."""
         del basic_static_config["type"]
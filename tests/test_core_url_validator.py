@@ -1,5 +1,6 @@
 """Tests for URLValidator class (core/validator.py)."""
 
+import urllib.error
 from unittest.mock import MagicMock, Mock, patch
 
 from elfshoe.core import URLValidator
@@ -42,6 +43,89 @@ class TestURLValidator:
         result = URLValidator.check_url("http://example.com/test", verbose=False)
         assert result is False
 
+    @patch("urllib.request.urlopen")
+    def test_check_url_head_rejected_falls_back_to_ranged_get(self, mock_urlopen):
+        """Test a 405 to HEAD retries with a 1-byte ranged GET."""
+        mock_response = MagicMock()
+        mock_response.status = 206
+        mock_response.geturl.return_value = "http://example.com/test"
+        mock_response.__enter__ = Mock(return_value=mock_response)
+        mock_response.__exit__ = Mock(return_value=False)
+
+        mock_urlopen.side_effect = [
+            urllib.error.HTTPError("http://example.com/test", 405, "Method Not Allowed", {}, None),
+            mock_response,
+        ]
+
+        result = URLValidator.check_url("http://example.com/test", verbose=False)
+        assert result is True
+        assert mock_urlopen.call_count == 2
+        retry_request = mock_urlopen.call_args_list[1][0][0]
+        assert retry_request.headers.get("Range") == "bytes=0-0"
+
+    @patch("urllib.request.urlopen")
+    def test_check_url_head_404_not_retried(self, mock_urlopen):
+        """Test a plain 404 fails without a GET retry."""
+        mock_urlopen.side_effect = urllib.error.HTTPError(
+            "http://example.com/test", 404, "Not Found", {}, None
+        )
+
+        result = URLValidator.check_url("http://example.com/test", verbose=False)
+        assert result is False
+        assert mock_urlopen.call_count == 1
+
+    @patch("urllib.request.urlopen")
+    def test_check_urls_mixed_results(self, mock_urlopen):
+        """Test batch URL check maps each URL to its own result."""
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.geturl.return_value = "http://example.com/good"
+        mock_response.__enter__ = Mock(return_value=mock_response)
+        mock_response.__exit__ = Mock(return_value=False)
+
+        def urlopen_side_effect(req, timeout=None):
+            if "bad" in req.full_url:
+                raise Exception("Not found")
+            return mock_response
+
+        mock_urlopen.side_effect = urlopen_side_effect
+
+        results = URLValidator.check_urls(
+            ["http://example.com/good", "http://example.com/bad"], verbose=False
+        )
+        assert results == {
+            "http://example.com/good": True,
+            "http://example.com/bad": False,
+        }
+
+    def test_check_urls_empty(self):
+        """Test batch URL check with no URLs."""
+        assert URLValidator.check_urls([]) == {}
+
+    @patch("urllib.request.urlopen")
+    def test_check_url_persistent_cache(self, mock_urlopen, temp_dir):
+        """Test cached results are reused without a network request."""
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.geturl.return_value = "http://example.com/test"
+        mock_response.__enter__ = Mock(return_value=mock_response)
+        mock_response.__exit__ = Mock(return_value=False)
+        mock_urlopen.return_value = mock_response
+
+        try:
+            URLValidator.enable_cache(temp_dir / "url-cache.json")
+
+            assert URLValidator.check_url("http://example.com/test", verbose=False) is True
+            assert URLValidator.check_url("http://example.com/test", verbose=False) is True
+            assert mock_urlopen.call_count == 1  # second check served from cache
+
+            URLValidator.save_cache()
+            assert (temp_dir / "url-cache.json").exists()
+        finally:
+            URLValidator._cache = None
+            URLValidator._cache_path = None
+            URLValidator._cache_ttl = 0
+
     @patch("urllib.request.urlopen")
     def test_verify_boot_files_success(self, mock_urlopen):
         """Test successful boot files verification."""
@@ -1,6 +1,7 @@
 """Tests for FedoraMetadataFetcher (distributions/fedora.py)."""
 
 import json
+import urllib.error
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -114,6 +115,78 @@ class TestFedoraMetadataFetcher:
 
         assert data == []
 
+    @patch("urllib.request.urlopen")
+    def test_fetch_metadata_writes_disk_cache(self, mock_urlopen, sample_fedora_releases, temp_dir):
+        """Test _fetch_metadata stores data and validators on disk."""
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps(sample_fedora_releases).encode()
+        mock_response.headers = {
+            "ETag": '"abc123"',
+            "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        mock_response.__enter__ = Mock(return_value=mock_response)
+        mock_response.__exit__ = Mock(return_value=False)
+        mock_urlopen.return_value = mock_response
+
+        fetcher = FedoraMetadataFetcher(cache_dir=temp_dir)
+        data = fetcher._fetch_metadata("http://example.com/releases.json")
+
+        assert data == sample_fedora_releases
+        document = json.loads(fetcher._cache_file("http://example.com/releases.json").read_text())
+        assert document["etag"] == '"abc123"'
+        assert document["last_modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert document["data"] == sample_fedora_releases
+
+    @patch("urllib.request.urlopen")
+    def test_fetch_metadata_304_serves_disk_cache(
+        self, mock_urlopen, sample_fedora_releases, temp_dir
+    ):
+        """Test _fetch_metadata serves the on-disk copy on 304 Not Modified."""
+        fetcher = FedoraMetadataFetcher(cache_dir=temp_dir)
+        cache_file = fetcher._cache_file("http://example.com/releases.json")
+        cache_file.write_text(
+            json.dumps(
+                {
+                    "etag": '"abc123"',
+                    "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+                    "data": sample_fedora_releases,
+                }
+            )
+        )
+        mock_urlopen.side_effect = urllib.error.HTTPError(
+            "http://example.com/releases.json", 304, "Not Modified", {}, None
+        )
+
+        data = fetcher._fetch_metadata("http://example.com/releases.json")
+
+        assert data == sample_fedora_releases
+        # The request carried the cached validators as conditional headers
+        request = mock_urlopen.call_args[0][0]
+        assert request.get_header("If-none-match") == '"abc123"'
+        assert request.get_header("If-modified-since") == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    @patch("urllib.request.urlopen")
+    def test_fetch_metadata_corrupt_disk_cache(
+        self, mock_urlopen, sample_fedora_releases, temp_dir
+    ):
+        """Test _fetch_metadata falls back to a full fetch on a corrupt cache."""
+        fetcher = FedoraMetadataFetcher(cache_dir=temp_dir)
+        fetcher._cache_file("http://example.com/releases.json").write_text("invalid json {[")
+
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps(sample_fedora_releases).encode()
+        mock_response.headers = {}
+        mock_response.__enter__ = Mock(return_value=mock_response)
+        mock_response.__exit__ = Mock(return_value=False)
+        mock_urlopen.return_value = mock_response
+
+        data = fetcher._fetch_metadata("http://example.com/releases.json")
+
+        assert data == sample_fedora_releases
+        # Corrupt cache means no validators, so no conditional headers
+        request = mock_urlopen.call_args[0][0]
+        assert request.get_header("If-none-match") is None
+
     @patch.object(FedoraMetadataFetcher, "_fetch_metadata")
     def test_fetch_versions_default_variant(self, mock_fetch, sample_fedora_releases):
         """Test fetch_versions with default Server variant."""
@@ -145,6 +218,24 @@ class TestFedoraMetadataFetcher:
         assert versions[1]["version"] == "39"
         assert versions[2]["version"] == "38"
 
+    @patch.object(FedoraMetadataFetcher, "_fetch_metadata")
+    def test_fetch_versions_non_numeric_version(self, mock_fetch, sample_fedora_releases):
+        """Test fetch_versions tolerates non-numeric versions like Rawhide."""
+        mock_fetch.return_value = sample_fedora_releases + [
+            {
+                "version": "Rawhide",
+                "arch": "x86_64",
+                "variant": "Server",
+                "link": "http://example.com/rawhide",
+            }
+        ]
+
+        fetcher = FedoraMetadataFetcher()
+        versions = fetcher.fetch_versions("http://example.com/releases.json")
+
+        # Numeric versions stay newest-first; Rawhide sorts last
+        assert [v["version"] for v in versions] == ["40", "39", "38", "Rawhide"]
+
     @patch.object(FedoraMetadataFetcher, "_fetch_metadata")
     def test_fetch_versions_architecture_grouping(self, mock_fetch, sample_fedora_releases):
         """Test fetch_versions groups architectures by version."""
@@ -2,6 +2,7 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 from elfshoe.validator import IPXEValidator, validate_and_report, validate_multiple_files
 
@@ -217,6 +218,76 @@ goto undefined_label
     assert "Errors: 1" in captured.out
 
 
+def test_validate_multiple_files_deduplicates_identical_content(capsys):
+    """Test validate_multiple_files validates duplicate content once."""
+    script = """#!ipxe
+echo Duplicated script
+"""
+
+    files = []
+    for i in range(2):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".ipxe", delete=False) as f:
+            f.write(script)
+            f.flush()
+            files.append(Path(f.name))
+
+    real_validate_file = IPXEValidator.validate_file
+    with patch.object(
+        IPXEValidator, "validate_file", autospec=True, side_effect=real_validate_file
+    ) as mock_validate:
+        result = validate_multiple_files(files)
+    captured = capsys.readouterr()
+
+    for f in files:
+        f.unlink()
+
+    assert result is True
+    # Identical content is only validated once...
+    mock_validate.assert_called_once()
+    # ...but every file still shows up in the report
+    for f in files:
+        assert f.name in captured.out
+    assert "Validated 2 file(s)" in captured.out
+
+
+def test_validate_multiple_files_parallel_batch(capsys):
+    """Test validate_multiple_files with enough files for the process pool."""
+    # Four unique scripts cross the parallel threshold; one is invalid
+    scripts = [
+        """#!ipxe
+echo Script 1
+""",
+        """#!ipxe
+echo Script 2
+""",
+        """#!ipxe
+goto undefined_label
+""",
+        """#!ipxe
+echo Script 4
+""",
+    ]
+
+    files = []
+    for i, script in enumerate(scripts):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".ipxe", delete=False) as f:
+            f.write(script)
+            f.flush()
+            files.append(Path(f.name))
+
+    result = validate_multiple_files(files)
+    captured = capsys.readouterr()
+
+    for f in files:
+        f.unlink()
+
+    assert result is False
+    assert "OK" in captured.out
+    assert "FAILED" in captured.out
+    assert "Validated 4 file(s)" in captured.out
+    assert "Errors: 1" in captured.out
+
+
 def test_validate_multiple_files_quiet(capsys):
     """Test validate_multiple_files in quiet mode."""
     script = """#!ipxe